@@ -0,0 +1,50 @@
+"""
+Pre-compile the MA sensitivity kernels ahead of time.
+
+Run once after install (or after a numba/numpy upgrade invalidates the
+cache):
+
+    python -m backtest._aot_build
+
+The kernels are declared with cache=True, so compiling them here against
+representative argument types writes the machine code to numba's on-disk
+cache next to _ma_kernel.py. Every later CLI run then loads the compiled
+code directly and the first backtest call has no JIT pause.
+
+(numba.pycc-style AOT extension modules were removed from numba; priming
+the cache gives the same no-warmup behavior without a build toolchain.)
+"""
+import numpy as np
+
+from backtest._ma_kernel import BOUNCE, scan_touches, scan_touches_batch, sma_multi
+
+
+def build() -> None:
+    """Compile all kernels by running them on small representative inputs."""
+    n = 128
+    close = np.linspace(10.0, 20.0, n)
+    low = close * 0.99
+    high = close * 1.01
+    periods = np.asarray([10, 20, 50], dtype=np.int64)
+
+    all_mas = sma_multi(close, periods)
+    scan_touches(
+        close, high, low, all_mas[:-1], periods[:-1], all_mas[-1],
+        1.0, 60, n - 5, 5, 3, BOUNCE,
+    )
+
+    out_idx = np.zeros((1, n), dtype=np.int64)
+    out_period = np.zeros((1, n), dtype=np.int64)
+    out_ret = np.zeros((1, n))
+    out_counts = np.zeros(1, dtype=np.int64)
+    scan_touches_batch(
+        close.reshape(1, n), low.reshape(1, n), high.reshape(1, n),
+        np.asarray([n], dtype=np.int64), periods, 50,
+        1.0, 5, 3, BOUNCE,
+        out_idx, out_period, out_ret, out_counts,
+    )
+
+
+if __name__ == "__main__":
+    build()
+    print("MA kernels compiled and cached.")
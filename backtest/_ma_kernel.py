@@ -0,0 +1,187 @@
+"""
+Numba-compiled hot loop for the MA sensitivity backtest.
+
+Kept in its own module so importing the backtest API never pays JIT compile
+time unless the kernel is actually invoked. cache=True persists the compiled
+code on disk, so repeated CLI runs (the scan command backtests up to 40
+tickers per invocation) skip the warmup entirely.
+"""
+import numpy as np
+from numba import njit, prange
+
+# Strategy ids -- must stay in sync with STRATEGIES in ma_sensitivity.py.
+BOUNCE = 0
+MAX_RETURN = 1
+
+
+@njit(cache=True)
+def sma_multi(close, periods):
+    """
+    Simple moving averages for several periods over one price array.
+
+    Single-pass running sum per period (add the newest bar, drop the
+    oldest) instead of pandas' O(n*p) rolling machinery. Row k matches
+    periods[k]; the first p-1 entries of each row are NaN (warmup).
+    """
+    n = close.shape[0]
+    out = np.full((periods.shape[0], n), np.nan)
+    for k in range(periods.shape[0]):
+        p = periods[k]
+        if p <= 0 or p > n:
+            continue
+        s = 0.0
+        for i in range(p - 1):
+            s += close[i]
+        for i in range(p - 1, n):
+            s += close[i]
+            out[k, i] = s / p
+            s -= close[i - p + 1]
+    return out
+
+
+@njit(cache=True)
+def scan_touches(
+    close,
+    high,
+    low,
+    ma_arr,
+    periods,
+    trend,
+    touch_pct,
+    start_idx,
+    end_idx,
+    hold_days,
+    cooldown,
+    strategy_id,
+):
+    """
+    Walk the bar range, find MA touches with aligned trend, and measure
+    the strategy return for each counted touch.
+
+    Args:
+        close, high, low: float64 price arrays, full history.
+        ma_arr: (n_periods, n_bars) float64 array of MAs, fastest first.
+        periods: int64 array of MA periods matching ma_arr rows.
+        trend: float64 array of the slow trend MA.
+        touch_pct: Low at or below ma * (1 + touch_pct/100) counts as a
+            touch -- i.e. within touch_pct% above the MA, or anywhere below.
+        start_idx, end_idx: Bar range to scan.
+        hold_days: Days to hold after a touch to measure return.
+        cooldown: Minimum days between counted touches.
+        strategy_id: BOUNCE or MAX_RETURN.
+
+    Returns:
+        (idx, ma_period, return_pct) parallel arrays, one entry per touch.
+    """
+    n_periods = ma_arr.shape[0]
+    cap = max(0, end_idx - start_idx)
+    out_idx = np.empty(cap, dtype=np.int64)
+    out_period = np.empty(cap, dtype=np.int64)
+    out_ret = np.empty(cap, dtype=np.float64)
+    count = 0
+    last_touch_idx = -cooldown - 1  # allow first touch
+
+    # abs(dist_pct) <= touch_pct or dist_pct <= 0 reduces algebraically to
+    # low <= ma * (1 + touch_pct/100): a single compare per MA, no abs/or.
+    touch_scale = 1.0 + touch_pct * 0.01
+
+    for i in range(start_idx, end_idx):
+        # Cooldown check
+        if i - last_touch_idx < cooldown:
+            continue
+
+        # Ascending alignment: MA10 > MA20 > ... > trend_MA
+        aligned = True
+        for k in range(n_periods - 1):
+            if not (ma_arr[k, i] > ma_arr[k + 1, i]):
+                aligned = False
+                break
+        if aligned and not (ma_arr[n_periods - 1, i] > trend[i]):
+            aligned = False
+        if not aligned:
+            continue
+
+        # Check for MA touch (prefer faster MA, count once per day)
+        low_i = low[i]
+        for k in range(n_periods):
+            if low_i <= ma_arr[k, i] * touch_scale:
+                entry = close[i]
+                if strategy_id == MAX_RETURN:
+                    max_high = high[i + 1]
+                    for j in range(i + 2, i + hold_days + 1):
+                        if high[j] > max_high:
+                            max_high = high[j]
+                    ret = (max_high - entry) / entry * 100.0
+                else:
+                    ret = (close[i + hold_days] - entry) / entry * 100.0
+
+                out_idx[count] = i
+                out_period[count] = periods[k]
+                out_ret[count] = ret
+                count += 1
+                last_touch_idx = i
+                break
+
+    return out_idx[:count], out_period[:count], out_ret[:count]
+
+
+@njit(cache=True, parallel=True)
+def scan_touches_batch(
+    close2d,
+    low2d,
+    high2d,
+    lengths,
+    periods_with_trend,
+    min_period,
+    touch_pct,
+    hold_days,
+    cooldown,
+    strategy_id,
+    out_idx,
+    out_period,
+    out_ret,
+    out_counts,
+):
+    """
+    Run the touch scan for many tickers across cores.
+
+    Each ticker's backtest is independent, so the outer loop is a prange.
+    Inputs are padded (n_tickers, max_bars) arrays with per-ticker lengths;
+    outputs are padded the same way with out_counts giving the number of
+    touches filled per ticker. Tickers with too little history (fewer than
+    min_period + 50 bars) get zero touches, matching the single-ticker path.
+    """
+    n_tickers = close2d.shape[0]
+    for t in prange(n_tickers):
+        n = lengths[t]
+        if n < min_period + 50:
+            out_counts[t] = 0
+            continue
+
+        close = close2d[t, :n]
+        low = low2d[t, :n]
+        high = high2d[t, :n]
+
+        all_mas = sma_multi(close, periods_with_trend)
+
+        idx, per, ret = scan_touches(
+            close,
+            high,
+            low,
+            all_mas[:-1],
+            periods_with_trend[:-1],
+            all_mas[-1],
+            touch_pct,
+            min_period + 10,
+            n - hold_days,
+            hold_days,
+            cooldown,
+            strategy_id,
+        )
+
+        count = idx.shape[0]
+        out_counts[t] = count
+        for j in range(count):
+            out_idx[t, j] = idx[j]
+            out_period[t, j] = per[j]
+            out_ret[t, j] = ret[j]
@@ -1,34 +1,44 @@
 import logging
 from typing import Callable, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 
+from backtest._ma_kernel import (
+    BOUNCE,
+    MAX_RETURN,
+    scan_touches,
+    scan_touches_batch,
+    sma_multi,
+)
+
 logger = logging.getLogger(__name__)
 
 
 # ---------------------------------------------------------------------------
 # Strategy functions
 # ---------------------------------------------------------------------------
-# Each strategy takes (ohlcv, touch_idx, hold_days) and returns a float
-# representing the trade return in %. None = skip (not enough forward data).
+# Each strategy takes (close, high, touch_idx, hold_days) raw float64 arrays
+# and returns a float representing the trade return in %. None = skip (not
+# enough forward data). These are the reference implementations; the Numba
+# kernel in _ma_kernel.py inlines the same logic via the strategy ids below.
 
-def _bounce_return(ohlcv: pd.DataFrame, touch_idx: int, hold_days: int) -> Optional[float]:
+def _bounce_return(close: np.ndarray, high: np.ndarray, touch_idx: int, hold_days: int) -> Optional[float]:
     """Simple bounce: return % from touch-day close to close N days later."""
     exit_idx = touch_idx + hold_days
-    if exit_idx >= len(ohlcv):
+    if exit_idx >= len(close):
         return None
-    entry_price = ohlcv["Close"].iloc[touch_idx]
-    exit_price = ohlcv["Close"].iloc[exit_idx]
-    return (exit_price - entry_price) / entry_price * 100
+    entry_price = close[touch_idx]
+    return (close[exit_idx] - entry_price) / entry_price * 100
 
 
-def _bounce_max_return(ohlcv: pd.DataFrame, touch_idx: int, hold_days: int) -> Optional[float]:
+def _bounce_max_return(close: np.ndarray, high: np.ndarray, touch_idx: int, hold_days: int) -> Optional[float]:
     """Best possible return within the hold window (high watermark)."""
     exit_idx = touch_idx + hold_days
-    if exit_idx >= len(ohlcv):
+    if exit_idx >= len(close):
         return None
-    entry_price = ohlcv["Close"].iloc[touch_idx]
-    max_high = ohlcv["High"].iloc[touch_idx + 1 : exit_idx + 1].max()
+    entry_price = close[touch_idx]
+    max_high = high[touch_idx + 1 : exit_idx + 1].max()
     return (max_high - entry_price) / entry_price * 100
 
 
@@ -37,13 +47,20 @@ STRATEGIES: Dict[str, Callable] = {
     "max_return": _bounce_max_return,
 }
 
+_STRATEGY_IDS: Dict[str, int] = {
+    "bounce": BOUNCE,
+    "max_return": MAX_RETURN,
+}
+
 
 # ---------------------------------------------------------------------------
 # Core backtest
 # ---------------------------------------------------------------------------
 
-def backtest_ma_sensitivity(
-    ohlcv: pd.DataFrame,
+def backtest_ma_sensitivity_arrays(
+    close: np.ndarray,
+    low: np.ndarray,
+    high: np.ndarray,
     ma_periods: tuple = (10, 20),
     trend_ma: int = 50,
     touch_pct: float = 1.0,
@@ -52,14 +69,15 @@ def backtest_ma_sensitivity(
     strategy: str = "bounce",
 ) -> dict:
     """
-    Walk through OHLCV history, find all MA touch events where the trend
+    Walk through price history, find all MA touch events where the trend
     was aligned, and measure bounce success using the given strategy.
 
     Args:
-        ohlcv: Daily OHLCV DataFrame.
+        close, low, high: Daily float64 price arrays of equal length.
         ma_periods: Which MAs to test touches against (default MA10, MA20).
         trend_ma: Slow MA for trend alignment check.
-        touch_pct: Low must come within this % of an MA to count as touch.
+        touch_pct: Touch = low at or below ma * (1 + touch_pct/100), i.e.
+            within touch_pct% above the MA or anywhere below it.
         hold_days: How many days to hold after a touch to measure return.
         cooldown: Minimum days between counted touches (avoid double-counting).
         strategy: Name of the strategy function to use.
@@ -67,62 +85,182 @@ def backtest_ma_sensitivity(
     Returns:
         Dict with win_rate, avg_return, per-MA breakdowns, and backtest_score.
     """
-    strategy_fn = STRATEGIES.get(strategy, _bounce_return)
+    strategy_id = _STRATEGY_IDS.get(strategy, BOUNCE)
 
     min_period = max(max(ma_periods), trend_ma)
-    if len(ohlcv) < min_period + 50:
+    if len(close) < min_period + 50:
         return _empty_result(ma_periods)
 
-    close = ohlcv["Close"]
-    low = ohlcv["Low"]
-
-    # Compute MAs
-    mas = {p: close.rolling(p).mean() for p in ma_periods}
-    trend = close.rolling(trend_ma).mean()
+    # Sorted once per call; the kernel indexes precomputed MA rows by position
+    sorted_periods = tuple(sorted(ma_periods))
 
-    # Walk through history
-    touches: List[dict] = []
-    last_touch_idx = -cooldown - 1  # allow first touch
+    # Compute all MAs (fastest first, trend last) in one kernel call
+    periods_arr = np.asarray(sorted_periods + (trend_ma,), dtype=np.int64)
+    all_mas = sma_multi(close, periods_arr)
+    ma_arr = all_mas[:-1]
+    trend = all_mas[-1]
 
     start_idx = min_period + 10  # enough MA warmup
-    end_idx = len(ohlcv) - hold_days  # need forward data
-
-    for i in range(start_idx, end_idx):
-        # Cooldown check
-        if i - last_touch_idx < cooldown:
-            continue
-
-        # Trend alignment: all shorter MAs > trend MA
-        sorted_periods = sorted(ma_periods)
-        ma_values = [mas[p].iloc[i] for p in sorted_periods]
-        trend_val = trend.iloc[i]
-
-        # Check ascending alignment: MA10 > MA20 > ... > trend_MA
-        aligned = all(ma_values[j] > ma_values[j + 1] for j in range(len(ma_values) - 1))
-        aligned = aligned and ma_values[-1] > trend_val
-        if not aligned:
-            continue
-
-        # Check for MA touch
-        low_val = low.iloc[i]
-        for p in sorted_periods:
-            ma_val = mas[p].iloc[i]
-            dist_pct = (low_val - ma_val) / ma_val * 100
-
-            # Touch = low within touch_pct% (above or below)
-            if abs(dist_pct) <= touch_pct or dist_pct <= 0:
-                ret = strategy_fn(ohlcv, i, hold_days)
-                if ret is not None:
-                    touches.append({
-                        "idx": i,
-                        "ma_period": p,
-                        "return_pct": ret,
-                        "win": ret > 0,
-                    })
-                    last_touch_idx = i
-                break  # count once per day (prefer faster MA)
-
-    return _compute_metrics(touches, ma_periods)
+    end_idx = len(close) - hold_days  # need forward data
+
+    _idx_arr, period_arr, ret_arr = scan_touches(
+        close,
+        high,
+        low,
+        ma_arr,
+        periods_arr[:-1],
+        trend,
+        float(touch_pct),
+        start_idx,
+        end_idx,
+        hold_days,
+        cooldown,
+        strategy_id,
+    )
+
+    return _compute_metrics(period_arr, ret_arr, ma_periods)
+
+
+def backtest_ma_sensitivity_batch(
+    arrays: List[tuple],
+    ma_periods: tuple = (10, 20),
+    trend_ma: int = 50,
+    touch_pct: float = 1.0,
+    hold_days: int = 5,
+    cooldown: int = 3,
+    strategy: str = "bounce",
+) -> List[dict]:
+    """
+    Backtest many tickers in one parallel kernel dispatch.
+
+    Pads the per-ticker triples into the 2D layout and delegates to
+    backtest_ma_sensitivity_padded; callers that already hold padded
+    arrays (load_ohlcv_batch) should use that variant directly.
+
+    Args:
+        arrays: One (close, low, high) float64 ndarray triple per ticker.
+        Remaining args as for backtest_ma_sensitivity_arrays.
+
+    Returns:
+        One metrics dict per input triple, in order.
+    """
+    n_tickers = len(arrays)
+    if n_tickers == 0:
+        return []
+
+    # Pad into (n_tickers, max_bars) arrays; lengths mark the valid prefix
+    lengths = np.asarray([len(c) for c, _, _ in arrays], dtype=np.int64)
+    max_len = int(lengths.max())
+    close2d = np.zeros((n_tickers, max_len))
+    low2d = np.zeros((n_tickers, max_len))
+    high2d = np.zeros((n_tickers, max_len))
+    for t, (close, low, high) in enumerate(arrays):
+        close2d[t, : len(close)] = close
+        low2d[t, : len(low)] = low
+        high2d[t, : len(high)] = high
+
+    return backtest_ma_sensitivity_padded(
+        close2d,
+        low2d,
+        high2d,
+        lengths,
+        ma_periods=ma_periods,
+        trend_ma=trend_ma,
+        touch_pct=touch_pct,
+        hold_days=hold_days,
+        cooldown=cooldown,
+        strategy=strategy,
+    )
+
+
+def backtest_ma_sensitivity_padded(
+    close2d: np.ndarray,
+    low2d: np.ndarray,
+    high2d: np.ndarray,
+    lengths: np.ndarray,
+    ma_periods: tuple = (10, 20),
+    trend_ma: int = 50,
+    touch_pct: float = 1.0,
+    hold_days: int = 5,
+    cooldown: int = 3,
+    strategy: str = "bounce",
+) -> List[dict]:
+    """
+    Backtest pre-padded (n_tickers, max_bars) column arrays.
+
+    Takes the SoA layout produced by data.ohlcv_cache.load_ohlcv_batch:
+    one contiguous 2D array per column, rows zero-padded past each
+    ticker's history, lengths marking the valid prefixes. Results match
+    calling backtest_ma_sensitivity_arrays per ticker (rows with too
+    little history get the empty result), but the scan runs across cores
+    via numba.prange.
+    """
+    n_tickers, max_len = close2d.shape
+    if n_tickers == 0:
+        return []
+
+    strategy_id = _STRATEGY_IDS.get(strategy, BOUNCE)
+    min_period = max(max(ma_periods), trend_ma)
+    sorted_periods = tuple(sorted(ma_periods))
+    periods_arr = np.asarray(sorted_periods + (trend_ma,), dtype=np.int64)
+
+    out_idx = np.zeros((n_tickers, max_len), dtype=np.int64)
+    out_period = np.zeros((n_tickers, max_len), dtype=np.int64)
+    out_ret = np.zeros((n_tickers, max_len))
+    out_counts = np.zeros(n_tickers, dtype=np.int64)
+
+    scan_touches_batch(
+        close2d,
+        low2d,
+        high2d,
+        lengths,
+        periods_arr,
+        min_period,
+        float(touch_pct),
+        hold_days,
+        cooldown,
+        strategy_id,
+        out_idx,
+        out_period,
+        out_ret,
+        out_counts,
+    )
+
+    results = []
+    for t in range(n_tickers):
+        count = int(out_counts[t])
+        results.append(
+            _compute_metrics(out_period[t, :count], out_ret[t, :count], ma_periods)
+        )
+    return results
+
+
+def backtest_ma_sensitivity(
+    ohlcv: pd.DataFrame,
+    ma_periods: tuple = (10, 20),
+    trend_ma: int = 50,
+    touch_pct: float = 1.0,
+    hold_days: int = 5,
+    cooldown: int = 3,
+    strategy: str = "bounce",
+) -> dict:
+    """
+    DataFrame front-end for backtest_ma_sensitivity_arrays.
+
+    Extracts the Close/Low/High columns as float64 ndarrays; callers that
+    already hold raw arrays should use the arrays variant directly.
+    """
+    return backtest_ma_sensitivity_arrays(
+        ohlcv["Close"].to_numpy(dtype=np.float64, copy=False),
+        ohlcv["Low"].to_numpy(dtype=np.float64, copy=False),
+        ohlcv["High"].to_numpy(dtype=np.float64, copy=False),
+        ma_periods=ma_periods,
+        trend_ma=trend_ma,
+        touch_pct=touch_pct,
+        hold_days=hold_days,
+        cooldown=cooldown,
+        strategy=strategy,
+    )
 
 
 def _empty_result(ma_periods: tuple) -> dict:
@@ -138,16 +276,17 @@ def _empty_result(ma_periods: tuple) -> dict:
     return result
 
 
-def _compute_metrics(touches: List[dict], ma_periods: tuple) -> dict:
-    if not touches:
+def _compute_metrics(
+    touch_periods: np.ndarray, touch_returns: np.ndarray, ma_periods: tuple
+) -> dict:
+    """Aggregate parallel (ma_period, return_pct) touch arrays into metrics."""
+    total = len(touch_returns)
+    if total == 0:
         return _empty_result(ma_periods)
 
-    wins = sum(1 for t in touches if t["win"])
-    returns = [t["return_pct"] for t in touches]
-    total = len(touches)
-
-    win_rate = wins / total * 100
-    avg_return = sum(returns) / total
+    win_arr = touch_returns > 0
+    win_rate = int(win_arr.sum()) / total * 100
+    avg_return = float(touch_returns.sum()) / total
 
     result = {
         "win_rate": round(win_rate, 1),
@@ -157,11 +296,12 @@ def _compute_metrics(touches: List[dict], ma_periods: tuple) -> dict:
 
     # Per-MA breakdown
     for p in ma_periods:
-        ma_touches = [t for t in touches if t["ma_period"] == p]
-        if ma_touches:
-            ma_wins = sum(1 for t in ma_touches if t["win"])
-            result[f"ma{p}_win_rate"] = round(ma_wins / len(ma_touches) * 100, 1)
-            result[f"ma{p}_touches"] = len(ma_touches)
+        mask = touch_periods == p
+        ma_total = int(mask.sum())
+        if ma_total:
+            ma_wins = int(win_arr[mask].sum())
+            result[f"ma{p}_win_rate"] = round(ma_wins / ma_total * 100, 1)
+            result[f"ma{p}_touches"] = ma_total
         else:
             result[f"ma{p}_win_rate"] = 0.0
             result[f"ma{p}_touches"] = 0
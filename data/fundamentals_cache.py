@@ -1,10 +1,12 @@
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import pandas as pd
 import yfinance as yf
 from tqdm import tqdm
 
-from config import FUNDAMENTALS_PATH
+from config import FETCH_SLEEP_SECONDS, FETCH_WORKERS, FUNDAMENTALS_PATH
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +30,19 @@ FUNDAMENTAL_FIELDS = [
 ]
 
 
+def _fetch_info(ticker: str, today: pd.Timestamp) -> dict:
+    """Wrapper for thread pool. Falls back to an empty row on failure."""
+    try:
+        info = yf.Ticker(ticker).info
+        row = {field: info.get(field) for field in FUNDAMENTAL_FIELDS}
+    except Exception as e:
+        logger.warning(f"Failed to fetch fundamentals for {ticker}: {e}")
+        row = {}
+    row["ticker"] = ticker
+    row["_fetched_date"] = today
+    return row
+
+
 def fetch_fundamentals(
     tickers: list[str], use_cache: bool = True
 ) -> pd.DataFrame:
@@ -59,16 +74,23 @@ def fetch_fundamentals(
 
     logger.info(f"Fetching fundamentals for {len(to_fetch)} tickers ({len(tickers) - len(to_fetch)} cached)...")
     rows = []
-    for ticker in tqdm(to_fetch, desc="Fetching fundamentals"):
-        try:
-            info = yf.Ticker(ticker).info
-            row = {field: info.get(field) for field in FUNDAMENTAL_FIELDS}
-            row["ticker"] = ticker
-            row["_fetched_date"] = today
-            rows.append(row)
-        except Exception as e:
-            logger.warning(f"Failed to fetch fundamentals for {ticker}: {e}")
-            rows.append({"ticker": ticker, "_fetched_date": today})
+    total = len(to_fetch)
+
+    # Each .info call is a network round-trip; overlap them across a thread
+    # pool with rate-limit pauses between batches, like fetch_all_ohlcv.
+    # The pool persists across batches so threads warm up once.
+    with tqdm(total=total, desc="Fetching fundamentals") as pbar, ThreadPoolExecutor(
+        max_workers=FETCH_WORKERS
+    ) as executor:
+        for batch_start in range(0, total, FETCH_WORKERS):
+            batch = to_fetch[batch_start : batch_start + FETCH_WORKERS]
+
+            futures = [executor.submit(_fetch_info, t, today) for t in batch]
+            for future in as_completed(futures):
+                rows.append(future.result())
+                pbar.update(1)
+
+            time.sleep(FETCH_SLEEP_SECONDS)
 
     new_df = pd.DataFrame(rows).set_index("ticker")
 
@@ -2,7 +2,9 @@ import logging
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 import yfinance as yf
 from tqdm import tqdm
 
@@ -10,6 +12,29 @@ from config import FETCH_SLEEP_SECONDS, FETCH_WORKERS, OHLCV_DIR, OHLCV_HISTORY_
 
 logger = logging.getLogger(__name__)
 
+# Parquet write options for per-ticker OHLCV files (~1-2k rows each): a
+# single row group with light zstd decodes faster and smaller than the
+# snappy/64MB defaults, and dictionary pages are useless on float columns.
+_PARQUET_WRITE_KWARGS = dict(
+    compression="zstd",
+    compression_level=1,
+    row_group_size=8192,
+    use_dictionary=False,
+)
+
+# Prices carry at most ~6 significant digits, well within float32's 1.2e-7
+# relative epsilon; storing them as float32 halves price-column I/O.
+# Volume stays int64.
+_FLOAT32_COLS = ("Open", "High", "Low", "Close")
+
+
+def _downcast_prices(df: pd.DataFrame) -> pd.DataFrame:
+    """Downcast price columns to float32 before writing to parquet."""
+    for c in _FLOAT32_COLS:
+        if c in df.columns:
+            df[c] = df[c].astype(np.float32, copy=False)
+    return df
+
 
 def _latest_expected_date() -> pd.Timestamp:
     """
@@ -38,20 +63,118 @@ def _latest_expected_date() -> pd.Timestamp:
         return today - pd.Timedelta(days=1)
 
 
-def fetch_ohlcv(
+def load_ohlcv(ticker: str) -> pd.DataFrame | None:
+    """
+    Load a ticker's cached OHLCV as a DataFrame, no network access.
+
+    Reads via pyarrow with memory_map=True so repeated scans of the same
+    files serve data straight from the OS page cache instead of
+    re-buffering every parquet on each command.
+
+    Returns:
+        DataFrame with DatetimeIndex, or None if there is no cache file.
+    """
+    path = OHLCV_DIR / f"{ticker}.parquet"
+    if not path.exists():
+        return None
+    return pq.read_table(path, memory_map=True).to_pandas()
+
+
+def load_ohlcv_arrays(
+    ticker: str, columns: tuple = ("Close", "Low", "High")
+) -> dict | None:
+    """
+    Load selected cached OHLCV columns as float64 ndarrays.
+
+    Reads only the requested parquet columns and skips DataFrame and
+    DatetimeIndex reconstruction entirely -- for array-only consumers
+    (the backtest kernels) that is pure overhead.
+
+    Returns:
+        {column: ndarray} dict, or None if there is no cache file.
+    """
+    path = OHLCV_DIR / f"{ticker}.parquet"
+    if not path.exists():
+        return None
+    table = pq.read_table(path, columns=list(columns), memory_map=True)
+    return {
+        c: table.column(c).to_numpy(zero_copy_only=False).astype(np.float64, copy=False)
+        for c in columns
+    }
+
+
+def load_ohlcv_batch(
+    tickers: list[str], columns: tuple = ("Close", "Low", "High")
+) -> tuple[dict[str, np.ndarray], np.ndarray]:
+    """
+    Load many tickers' cached columns as padded 2D arrays (SoA layout).
+
+    Batch consumers (the parallel backtest kernel) want one contiguous
+    (n_tickers, max_bars) array per column instead of a Python list of
+    per-ticker arrays. Rows are zero-padded past each ticker's history;
+    the returned lengths array marks the valid prefix per row, with 0
+    for tickers that have no cache file.
+
+    Returns:
+        ({column: 2D float64 array}, lengths) with rows in input order.
+    """
+    per_ticker = [load_ohlcv_arrays(t, columns=columns) for t in tickers]
+    lengths = np.asarray(
+        [len(cols[columns[0]]) if cols is not None else 0 for cols in per_ticker],
+        dtype=np.int64,
+    )
+    max_len = int(lengths.max()) if len(lengths) else 0
+    batch = {c: np.zeros((len(tickers), max_len)) for c in columns}
+    for t, cols in enumerate(per_ticker):
+        if cols is None:
+            continue
+        for c in columns:
+            batch[c][t, : lengths[t]] = cols[c]
+    return batch, lengths
+
+
+def _cached_last_date(parquet_path) -> pd.Timestamp | None:
+    """
+    Read the newest cached date from the parquet footer statistics.
+
+    Only the footer is parsed -- no data pages are decoded -- so checking
+    an up-to-date cache costs microseconds instead of a full file read.
+    Returns None if the statistics are missing or unreadable.
+    """
+    try:
+        meta = pq.read_metadata(parquet_path)
+        names = meta.schema.names
+        idx_cols = [
+            i for i, n in enumerate(names)
+            if n == "Date" or n.startswith("__index_level_")
+        ]
+        if not idx_cols:
+            return None
+        col = idx_cols[0]
+        max_val = None
+        for rg in range(meta.num_row_groups):
+            stats = meta.row_group(rg).column(col).statistics
+            if stats is None or not stats.has_min_max:
+                return None
+            if max_val is None or stats.max > max_val:
+                max_val = stats.max
+        return pd.Timestamp(max_val) if max_val is not None else None
+    except Exception:
+        return None
+
+
+def refresh_ohlcv(
     ticker: str, years: int = OHLCV_HISTORY_YEARS, force_full: bool = False
-) -> pd.DataFrame:
+) -> None:
     """
-    Fetch daily OHLCV for a single ticker with incremental caching.
+    Ensure the on-disk OHLCV cache for a ticker covers the latest trading day.
 
     Cache logic:
-      - Compare last date in cached data against the latest trading day.
-      - If cache already covers it → return cached data, no network call.
+      - Footer-statistics check: cache already covers the latest trading
+        day → return without deserializing the file (the common case on
+        repeated runs the same day).
       - Otherwise → incremental fetch from last cached date onward.
       - No cache or force_full → full historical fetch.
-
-    Returns:
-        Combined DataFrame with DatetimeIndex and columns [Open, High, Low, Close, Volume].
     """
     OHLCV_DIR.mkdir(parents=True, exist_ok=True)
     parquet_path = OHLCV_DIR / f"{ticker}.parquet"
@@ -59,6 +182,11 @@ def fetch_ohlcv(
     latest_td = _latest_expected_date()
 
     if parquet_path.exists() and not force_full:
+        # Cheap freshness probe before paying for a full parquet read
+        stat_date = _cached_last_date(parquet_path)
+        if stat_date is not None and stat_date.normalize() >= latest_td:
+            return
+
         cached_df = pd.read_parquet(parquet_path)
 
         if not cached_df.empty:
@@ -66,7 +194,7 @@ def fetch_ohlcv(
 
             # Cache already has the latest trading day → fresh
             if last_date >= latest_td:
-                return cached_df
+                return
 
             # Incremental fetch from day after last cached date
             start = (last_date + pd.Timedelta(days=1)).strftime("%Y-%m-%d")
@@ -77,33 +205,60 @@ def fetch_ohlcv(
         if not new_df.empty:
             if new_df.index.tz is not None:
                 new_df.index = new_df.index.tz_localize(None)
+
+            if not cached_df.empty:
+                # We requested start=last_date+1, so new rows are strictly
+                # after the cache; a defensive filter covers the rare
+                # overlapping response and the append needs no full-history
+                # dedup scan or sort.
+                new_df = new_df[new_df.index > last_date]
+                if new_df.empty:
+                    return
+                if not new_df.index.is_monotonic_increasing:
+                    new_df = new_df.sort_index()
+
             combined = pd.concat([cached_df, new_df])
-            combined = combined[~combined.index.duplicated(keep="last")]
-            combined.sort_index(inplace=True)
             ohlcv_cols = ["Open", "High", "Low", "Close", "Volume"]
             combined = combined[[c for c in ohlcv_cols if c in combined.columns]]
-            combined.to_parquet(parquet_path)
-            return combined
-        return cached_df
+            combined = _downcast_prices(combined)
+            combined.to_parquet(parquet_path, **_PARQUET_WRITE_KWARGS)
     else:
         # Full fetch
         start = (today - pd.DateOffset(years=years)).strftime("%Y-%m-%d")
         df = yf.Ticker(ticker).history(start=start, auto_adjust=True)
         if df.empty:
             logger.warning(f"No OHLCV data returned for {ticker}")
-            return df
+            return
         if df.index.tz is not None:
             df.index = df.index.tz_localize(None)
         ohlcv_cols = ["Open", "High", "Low", "Close", "Volume"]
         df = df[[c for c in ohlcv_cols if c in df.columns]]
-        df.to_parquet(parquet_path)
-        return df
+        df = _downcast_prices(df)
+        df.to_parquet(parquet_path, **_PARQUET_WRITE_KWARGS)
+
+
+def fetch_ohlcv(
+    ticker: str, years: int = OHLCV_HISTORY_YEARS, force_full: bool = False
+) -> pd.DataFrame:
+    """
+    Fetch daily OHLCV for a single ticker with incremental caching.
+
+    Updates the cache via refresh_ohlcv, then loads it. Update-only
+    callers (the bulk fetcher) use refresh_ohlcv directly and skip the
+    load entirely when the cache is already fresh.
+
+    Returns:
+        Combined DataFrame with DatetimeIndex and columns [Open, High, Low, Close, Volume].
+    """
+    refresh_ohlcv(ticker, years=years, force_full=force_full)
+    df = load_ohlcv(ticker)
+    return df if df is not None else pd.DataFrame()
 
 
 def _fetch_one(ticker: str, years: int, force_full: bool) -> tuple[str, bool, str]:
     """Wrapper for thread pool. Returns (ticker, success, error_msg)."""
     try:
-        fetch_ohlcv(ticker, years=years, force_full=force_full)
+        refresh_ohlcv(ticker, years=years, force_full=force_full)
         return (ticker, True, "")
     except Exception as e:
         return (ticker, False, str(e))
@@ -123,22 +278,25 @@ def fetch_all_ohlcv(
     failed = []
     total = len(tickers)
 
-    with tqdm(total=total, desc="Fetching OHLCV") as pbar:
-        # Process in batches to allow rate-limit pauses
+    # One pool for the whole run: threads (and their urllib3 connection
+    # pools) warm up once instead of being created and torn down per batch.
+    # Batches only gate submission for the rate-limit pauses.
+    with tqdm(total=total, desc="Fetching OHLCV") as pbar, ThreadPoolExecutor(
+        max_workers=FETCH_WORKERS
+    ) as executor:
         for batch_start in range(0, total, FETCH_WORKERS):
             batch = tickers[batch_start : batch_start + FETCH_WORKERS]
 
-            with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
-                futures = {
-                    executor.submit(_fetch_one, t, years, force_full): t
-                    for t in batch
-                }
-                for future in as_completed(futures):
-                    ticker, success, err = future.result()
-                    if not success:
-                        failed.append(ticker)
-                        logger.warning(f"Failed {ticker}: {err}")
-                    pbar.update(1)
+            futures = {
+                executor.submit(_fetch_one, t, years, force_full): t
+                for t in batch
+            }
+            for future in as_completed(futures):
+                ticker, success, err = future.result()
+                if not success:
+                    failed.append(ticker)
+                    logger.warning(f"Failed {ticker}: {err}")
+                pbar.update(1)
 
             time.sleep(FETCH_SLEEP_SECONDS)
 
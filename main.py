@@ -1,5 +1,7 @@
 import logging
+import operator
 import sys
+from datetime import datetime
 
 import click
 import pandas as pd
@@ -21,6 +23,18 @@ def cli():
     pass
 
 
+def _load_fund_records() -> dict:
+    """
+    Load cached fundamentals as {ticker: {field: value}}.
+
+    Plain dicts give O(1) per-ticker lookups in the scan loops instead of
+    a label-based .loc indexer call that materializes a Series per ticker.
+    """
+    if not FUNDAMENTALS_PATH.exists():
+        return {}
+    return pd.read_parquet(FUNDAMENTALS_PATH).to_dict(orient="index")
+
+
 @cli.command("fetch-universe")
 @click.option("--cap", type=float, default=5, show_default=True, help="Min market cap in billions. 0 = no filter.")
 def refresh_tickers(cap):
@@ -76,6 +90,7 @@ def fetch_data(years, full, ticker, fundamentals_only, ohlcv_only):
 def scan(scanner, export_csv, top, param, ticker, no_update):
     """Run an analyzer against cached data. Updates OHLCV data first by default."""
     from scanners.registry import auto_discover, get_scanner
+    from scanners.runner import run_scan
     from output.formatter import print_results, export_csv as do_export_csv
     from data.ohlcv_cache import fetch_all_ohlcv
     from tickers.universe import load_universe
@@ -99,55 +114,50 @@ def scan(scanner, export_csv, top, param, ticker, no_update):
         if failed:
             click.echo(f"  {len(failed)} tickers failed to update.")
 
-    fundamentals_df = None
-    if FUNDAMENTALS_PATH.exists():
-        fundamentals_df = pd.read_parquet(FUNDAMENTALS_PATH)
+    fund_records = _load_fund_records()
 
-    results = []
-    skipped = 0
-    for sym in tqdm(symbols, desc=f"Scanning [{scanner}]"):
-        ohlcv_path = OHLCV_DIR / f"{sym}.parquet"
-        if not ohlcv_path.exists():
-            skipped += 1
-            continue
+    to_scan = [sym for sym in symbols if (OHLCV_DIR / f"{sym}.parquet").exists()]
+    skipped = len(symbols) - len(to_scan)
 
-        ohlcv = pd.read_parquet(ohlcv_path)
-        if fundamentals_df is not None and sym in fundamentals_df.index:
-            fund = fundamentals_df.loc[sym]
-        else:
-            fund = pd.Series()
-
-        result = scanner_obj.scan(sym, ohlcv, fund)
-        if result is not None:
-            results.append(result)
+    # Each scan is independent and CPU-bound; run_scan shards the universe
+    # across worker processes that read their own parquets.
+    results = run_scan(scanner_obj, to_scan, fund_records)
 
     if skipped:
         click.echo(f"  Skipped {skipped} tickers (no OHLCV cache).")
 
-    results = sorted(results, key=lambda r: r.score, reverse=True)
+    results.sort(key=operator.attrgetter("score"), reverse=True)
     if top:
         results = results[:top]
 
     # Auto-backtest top results
     if results:
-        from backtest.ma_sensitivity import backtest_ma_sensitivity
+        from backtest.ma_sensitivity import backtest_ma_sensitivity_padded
+        from data.ohlcv_cache import load_ohlcv_batch
 
         bt_top = min(len(results), top or 40)
         click.echo(f"Backtesting top {bt_top} results...")
-        for r in results[:bt_top]:
-            ohlcv_path = OHLCV_DIR / f"{r.ticker}.parquet"
-            ohlcv = pd.read_parquet(ohlcv_path)
-            bt = backtest_ma_sensitivity(ohlcv)
+        # Columnar re-reads of just the top N, straight into the padded
+        # 2D layout the parallel kernel consumes -- cheaper than shipping
+        # every scanned frame back from the worker processes.
+        batch, lengths = load_ohlcv_batch([r.ticker for r in results[:bt_top]])
+        bt_results = backtest_ma_sensitivity_padded(
+            batch["Close"], batch["Low"], batch["High"], lengths
+        )
+
+        # One parallel kernel dispatch across all top tickers
+        for r, bt in zip(results[:bt_top], bt_results):
             r.details["bt"] = f"{bt['win_rate']}%/{bt['avg_return']}/{bt['total_touches']}n"
             # Combined score: 60% scan + 40% backtest
             r.score = round(r.score * 0.6 + bt["backtest_score"] * 0.4, 1)
 
-        results = sorted(results, key=lambda r: r.score, reverse=True)
+        results.sort(key=operator.attrgetter("score"), reverse=True)
 
     if results:
-        print_results(results, scanner)
+        run_ts = datetime.now()
+        print_results(results, scanner, run_ts=run_ts)
         if export_csv:
-            path = do_export_csv(results, scanner, OUTPUT_DIR)
+            path = do_export_csv(results, scanner, OUTPUT_DIR, run_ts=run_ts)
             click.echo(f"CSV exported to {path}")
     else:
         click.echo("No results matched the scanner criteria.")
@@ -176,9 +186,10 @@ def list_analyzers():
 @click.option("--csv", "export_csv", is_flag=True, help="Export results to CSV.")
 def backtest_cmd(ticker, scanner, top, hold_days, strategy, export_csv):
     """Run MA sensitivity backtest on tickers or scan results."""
-    from backtest.ma_sensitivity import backtest_ma_sensitivity, list_strategies
+    from backtest.ma_sensitivity import backtest_ma_sensitivity_arrays, list_strategies
+    from data.ohlcv_cache import load_ohlcv_arrays
     from output.formatter import print_results, export_csv as do_export_csv
-    from scanners.base import ScanResult
+    from scanners.base import BUY, STRONG_BUY, WATCH, ScanResult
 
     symbols = []
 
@@ -186,7 +197,7 @@ def backtest_cmd(ticker, scanner, top, hold_days, strategy, export_csv):
         symbols = list(ticker)
     elif scanner:
         from scanners.registry import auto_discover, get_scanner
-        from data.ohlcv_cache import fetch_all_ohlcv
+        from scanners.runner import run_scan
         from tickers.universe import load_universe
 
         auto_discover()
@@ -196,22 +207,11 @@ def backtest_cmd(ticker, scanner, top, hold_days, strategy, export_csv):
         all_symbols = tickers_df["symbol"].tolist()
 
         click.echo(f"Running scanner [{scanner}] on {len(all_symbols)} tickers...")
-        fundamentals_df = None
-        if FUNDAMENTALS_PATH.exists():
-            fundamentals_df = pd.read_parquet(FUNDAMENTALS_PATH)
-
-        scan_results = []
-        for sym in tqdm(all_symbols, desc=f"Scanning [{scanner}]"):
-            ohlcv_path = OHLCV_DIR / f"{sym}.parquet"
-            if not ohlcv_path.exists():
-                continue
-            ohlcv = pd.read_parquet(ohlcv_path)
-            fund = fundamentals_df.loc[sym] if fundamentals_df is not None and sym in fundamentals_df.index else pd.Series()
-            result = scanner_obj.scan(sym, ohlcv, fund)
-            if result is not None:
-                scan_results.append(result)
-
-        scan_results = sorted(scan_results, key=lambda r: r.score, reverse=True)[:top]
+        fund_records = _load_fund_records()
+
+        scan_results = run_scan(scanner_obj, all_symbols, fund_records)
+        scan_results.sort(key=operator.attrgetter("score"), reverse=True)
+        scan_results = scan_results[:top]
         symbols = [r.ticker for r in scan_results]
         click.echo(f"Top {len(symbols)} results selected for backtesting.")
     else:
@@ -221,20 +221,23 @@ def backtest_cmd(ticker, scanner, top, hold_days, strategy, export_csv):
     # Run backtest
     results = []
     for sym in tqdm(symbols, desc="Backtesting"):
-        ohlcv_path = OHLCV_DIR / f"{sym}.parquet"
-        if not ohlcv_path.exists():
+        cols = load_ohlcv_arrays(sym)
+        if cols is None:
             click.echo(f"  {sym}: no OHLCV data, skipping.")
             continue
 
-        ohlcv = pd.read_parquet(ohlcv_path)
-        bt = backtest_ma_sensitivity(
-            ohlcv, hold_days=hold_days, strategy=strategy,
+        bt = backtest_ma_sensitivity_arrays(
+            cols["Close"],
+            cols["Low"],
+            cols["High"],
+            hold_days=hold_days,
+            strategy=strategy,
         )
 
         results.append(ScanResult(
             ticker=sym,
             score=bt["backtest_score"],
-            signal="STRONG_BUY" if bt["win_rate"] >= 65 else ("BUY" if bt["win_rate"] >= 50 else "WATCH"),
+            signal=STRONG_BUY if bt["win_rate"] >= 65 else (BUY if bt["win_rate"] >= 50 else WATCH),
             details={
                 "win%": bt["win_rate"],
                 "avg%": bt["avg_return"],
@@ -247,9 +250,11 @@ def backtest_cmd(ticker, scanner, top, hold_days, strategy, export_csv):
         ))
 
     if results:
-        print_results(results, f"backtest ({strategy}, {hold_days}d)")
+        results.sort(key=operator.attrgetter("score"), reverse=True)
+        run_ts = datetime.now()
+        print_results(results, f"backtest ({strategy}, {hold_days}d)", run_ts=run_ts)
         if export_csv:
-            path = do_export_csv(results, f"backtest_{strategy}", OUTPUT_DIR)
+            path = do_export_csv(results, f"backtest_{strategy}", OUTPUT_DIR, run_ts=run_ts)
             click.echo(f"CSV exported to {path}")
     else:
         click.echo("No backtest results.")
@@ -0,0 +1,147 @@
+"""
+Numba-compiled lookback loop for the entry-point scanner.
+
+The per-candle signal logic here mirrors EntryPointScanner exactly; the
+scanner keeps the documentation and scoring context, this module keeps
+the hot loop on raw ndarrays. cache=True persists the compiled code so
+repeated CLI runs skip the warmup.
+
+Unlike the backtest kernels, this degrades gracefully without numba: the
+shim below leaves the functions as plain Python, which is slow but
+correct (the loop only covers `lookback` candles per ticker).
+"""
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is a declared dependency
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Signal codes returned by scan_entry, weakest to strongest.
+NO_SIGNAL = 0
+APPROACHING = 1
+TOUCH = 2
+HAMMER = 3
+
+SIGNAL_NAMES = {
+    APPROACHING: "APPROACHING",
+    TOUCH: "TOUCH",
+    HAMMER: "HAMMER",
+}
+
+
+@njit(cache=True, fastmath=True)
+def _is_hammer(open_, high, low, close, wick_body_ratio, upper_wick_max):
+    """Hammer / dragonfly doji test -- see EntryPointScanner._detect_hammer."""
+    total_range = high - low
+    if total_range <= 0:
+        return False
+
+    body = abs(close - open_)
+    body_top = max(close, open_)
+    body_bottom = min(close, open_)
+    lower_wick = body_bottom - low
+    upper_wick = high - body_top
+
+    if body < total_range * 0.05:
+        # Doji-like: lower wick should be >60% of range, upper wick small
+        return (lower_wick > total_range * 0.6
+                and upper_wick < total_range * upper_wick_max)
+
+    return (lower_wick >= body * wick_body_ratio
+            and upper_wick < total_range * upper_wick_max)
+
+
+@njit(cache=True, fastmath=True)
+def scan_entry(
+    open_,
+    high,
+    low,
+    close,
+    ma_fast,
+    ma_mid,
+    lookback,
+    approach_pct,
+    touch_pct,
+    wick_body_ratio,
+    upper_wick_max,
+):
+    """
+    Scan the last `lookback` candles for the best entry signal.
+
+    Args:
+        open_, high, low, close: float64 price arrays, full history.
+        ma_fast, ma_mid: Full-length daily MA arrays (MA10/MA20).
+        Remaining args: EntryPointScanner thresholds.
+
+    Returns:
+        (best_score, signal_code, ma_index, low_dist_pct, close_dist_pct,
+        candle_ago) -- signal_code is NO_SIGNAL if nothing matched,
+        ma_index is 0 for ma_fast and 1 for ma_mid, and the dist values
+        are the raw (signed) percentages of the winning candle.
+    """
+    n = close.shape[0]
+    best_score = 0.0
+    best_signal = NO_SIGNAL
+    best_ma = 0
+    best_low_dist = 0.0
+    best_close_dist = 0.0
+    best_ago = 0
+
+    start = n - lookback
+    if start < 0:
+        start = 0
+
+    for idx in range(start, n):
+        ago = n - 1 - idx  # 0 = most recent, 1 = yesterday...
+        # Recency multiplier: ago=0 → 1.0, ago=1 → 0.7, ago=2 → 0.4, ...
+        # max/abs clamps throughout compile to branchless scalar min/max
+        # under fastmath, keeping the loop body free of data-dependent jumps.
+        recency = max(0.0, 1.0 - ago * 0.3)
+
+        o = open_[idx]
+        h = high[idx]
+        l = low[idx]  # noqa: E741
+        c = close[idx]
+
+        for k in range(2):
+            ma_val = ma_fast[idx] if k == 0 else ma_mid[idx]
+            close_dist_pct = (c - ma_val) / ma_val * 100.0
+            low_dist_pct = (l - ma_val) / ma_val * 100.0
+
+            # Close must be above MA20 (the floor); below MA10 is ok (entry zone)
+            if k == 1 and c < ma_val:
+                continue
+
+            # "Within touch_pct% of the MA, or pierced below it" collapses
+            # to one signed comparison: any low at or under the MA has
+            # low_dist_pct <= 0 <= touch_pct.
+            low_near_ma = low_dist_pct <= touch_pct
+
+            # HAMMER at MA (strongest), then TOUCH, then APPROACHING --
+            # a hammer candle never also counts as a touch.
+            if low_near_ma and _is_hammer(o, h, l, c, wick_body_ratio, upper_wick_max):
+                proximity = max(0.0, 1.0 - abs(low_dist_pct) / max(touch_pct, 0.01))
+                s = (40.0 + proximity * 20.0) * recency
+                sig = HAMMER
+            elif low_near_ma:
+                proximity = max(0.0, 1.0 - abs(low_dist_pct) / max(touch_pct, 0.01))
+                s = (25.0 + proximity * 15.0) * recency
+                sig = TOUCH
+            elif abs(close_dist_pct) <= approach_pct:
+                proximity = max(0.0, 1.0 - abs(close_dist_pct) / approach_pct)
+                s = (10.0 + proximity * 15.0) * recency
+                sig = APPROACHING
+            else:
+                continue
+
+            if s > best_score:
+                best_score = s
+                best_signal = sig
+                best_ma = k
+                best_low_dist = low_dist_pct
+                best_close_dist = close_dist_pct
+                best_ago = ago
+
+    return best_score, best_signal, best_ma, best_low_dist, best_close_dist, best_ago
@@ -1,17 +1,27 @@
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from typing import Optional
+from sys import intern
+from typing import ClassVar, Optional
 
+import numpy as np
 import pandas as pd
 
+# Shared signal constants. Scanners should return these rather than fresh
+# literals so the thousands of per-result strings are three interned
+# objects that compare by identity.
+STRONG_BUY = intern("STRONG_BUY")
+BUY = intern("BUY")
+WATCH = intern("WATCH")
 
-@dataclass
+
+@dataclass(slots=True)
 class ScanResult:
     """Result of a scanner evaluating a single ticker."""
 
     ticker: str
     score: float
-    signal: str  # e.g. "BUY", "WATCH", "STRONG_BUY"
+    signal: str  # STRONG_BUY / BUY / WATCH
     details: dict = field(default_factory=dict)
 
     def __post_init__(self):
@@ -21,24 +31,19 @@ class ScanResult:
 class BaseScanner(ABC):
     """Base class for all scanners."""
 
-    @property
-    @abstractmethod
-    def name(self) -> str:
-        """Short identifier used in CLI --scanner flag."""
-        ...
-
-    @property
-    @abstractmethod
-    def description(self) -> str:
-        """Human-readable description for help text."""
-        ...
+    # Class-level so the registry can read them without instantiating:
+    # short identifier for the CLI --scanner flag, and a human-readable
+    # description for help text. Subclasses must override both.
+    name: ClassVar[str]
+    description: ClassVar[str]
 
     @abstractmethod
     def scan(
         self,
         ticker: str,
         ohlcv: pd.DataFrame,
-        fundamentals: pd.Series,
+        fundamentals: Mapping,
+        resampled: Optional[dict] = None,
     ) -> Optional[ScanResult]:
         """
         Evaluate a single ticker.
@@ -47,7 +52,12 @@ class BaseScanner(ABC):
             ticker: The stock symbol.
             ohlcv: DataFrame with columns [Open, High, Low, Close, Volume],
                    DatetimeIndex, sorted ascending. Always daily frequency.
-            fundamentals: Series with fundamental data for this ticker.
+            fundamentals: Mapping of fundamental fields for this ticker
+                          (plain dict or pd.Series; may be empty).
+            resampled: Optional {freq: DataFrame} cache of pre-resampled
+                       frames, so a driver running several scanners over
+                       the same ticker resamples once. Scanners fall back
+                       to resample_ohlcv when it is None or misses a freq.
 
         Returns:
             ScanResult if the ticker passes the scan, None otherwise.
@@ -59,12 +69,34 @@ class BaseScanner(ABC):
         pass
 
 
+def sma(arr: np.ndarray, n: int) -> np.ndarray:
+    """
+    Simple moving average of a float array via one cumulative sum.
+
+    Returns a full-length array with NaN for the first n-1 entries, so
+    positional (and negative) indexing lines up with the input exactly
+    like the rolling().mean() Series it replaces -- without pandas'
+    per-call rolling machinery or Series allocations.
+    """
+    out = np.full(arr.shape, np.nan)
+    if 0 < n <= arr.shape[0]:
+        cs = np.cumsum(arr)
+        out[n - 1] = cs[n - 1] / n
+        out[n:] = (cs[n:] - cs[:-n]) / n
+    return out
+
+
 def resample_ohlcv(daily_df: pd.DataFrame, freq: str = "W") -> pd.DataFrame:
     """
     Resample daily OHLCV to a lower frequency.
 
+    The weekly case -- the one every scanner hits per ticker -- is done
+    directly with ufunc.reduceat over contiguous week groups, skipping
+    pandas' resample/groupby machinery. Other frequencies go through
+    pandas.
+
     Args:
-        daily_df: Daily OHLCV DataFrame with DatetimeIndex.
+        daily_df: Daily OHLCV DataFrame with DatetimeIndex, sorted ascending.
         freq: Pandas frequency string. Common values:
               'W'  - weekly
               'ME' - month-end
@@ -73,6 +105,8 @@ def resample_ohlcv(daily_df: pd.DataFrame, freq: str = "W") -> pd.DataFrame:
     Returns:
         Resampled OHLCV DataFrame.
     """
+    if freq == "W" and len(daily_df):
+        return _resample_weekly(daily_df)
     return (
         daily_df.resample(freq)
         .agg(
@@ -86,3 +120,37 @@ def resample_ohlcv(daily_df: pd.DataFrame, freq: str = "W") -> pd.DataFrame:
         )
         .dropna()
     )
+
+
+def _resample_weekly(daily_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Weekly OHLCV aggregation equivalent to resample('W').agg(...).dropna().
+
+    Bars are bucketed by the Sunday that ends their week: epoch day 0
+    (1970-01-01) was a Thursday, so shifting by 3 days makes integer
+    division by 7 split exactly on Mon..Sun weeks, and week w is labelled
+    7*w + 3 days after the epoch (its Sunday). Because groups are built
+    only where bars exist, empty calendar weeks never appear -- the same
+    rows resample's dropna() would discard.
+    """
+    # datetime64[D] handles any index resolution (s/ms/us/ns) uniformly.
+    days = daily_df.index.values.astype("datetime64[D]").view("int64")
+    week_id = (days + 3) // 7
+
+    # Group starts: index 0 plus every position where the week changes.
+    starts = np.flatnonzero(np.diff(week_id)) + 1
+    starts = np.concatenate(([0], starts))
+    ends = np.concatenate((starts[1:], [len(days)])) - 1
+
+    data = {
+        "Open": daily_df["Open"].to_numpy()[starts],
+        "High": np.maximum.reduceat(daily_df["High"].to_numpy(), starts),
+        "Low": np.minimum.reduceat(daily_df["Low"].to_numpy(), starts),
+        "Close": daily_df["Close"].to_numpy()[ends],
+        "Volume": np.add.reduceat(daily_df["Volume"].to_numpy(), starts),
+    }
+    labels = pd.DatetimeIndex(
+        (7 * week_id[starts] + 3).astype("datetime64[D]").astype(daily_df.index.dtype),
+        name=daily_df.index.name,
+    )
+    return pd.DataFrame(data, index=labels)
@@ -1,8 +1,19 @@
+from collections.abc import Mapping
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
-from scanners.base import BaseScanner, ScanResult, resample_ohlcv
+from scanners._entry_kernels import NO_SIGNAL, SIGNAL_NAMES, scan_entry
+from scanners.base import (
+    BUY,
+    STRONG_BUY,
+    WATCH,
+    BaseScanner,
+    ScanResult,
+    resample_ohlcv,
+    sma,
+)
 from scanners.registry import register
 
 
@@ -62,55 +73,28 @@ class EntryPointScanner(BaseScanner):
             if key in kwargs:
                 setattr(self, key, float(kwargs[key]))
 
-    def _detect_hammer(self, open_: float, high: float, low: float, close: float) -> bool:
-        """
-        Detect a hammer / dragonfly doji (reversed T) candle.
-
-        Characteristics:
-          - Long lower shadow (wick >= wick_body_ratio x body)
-          - Small or no upper shadow (< upper_wick_max of total range)
-          - Body is in the upper portion of the candle
-        """
-        total_range = high - low
-        if total_range <= 0:
-            return False
-
-        body = abs(close - open_)
-        body_top = max(close, open_)
-        body_bottom = min(close, open_)
-        lower_wick = body_bottom - low
-        upper_wick = high - body_top
-
-        # Lower wick must be significant relative to body
-        # For doji (tiny body), just check lower wick is majority of range
-        if body < total_range * 0.05:
-            # Doji-like: lower wick should be >60% of range, upper wick small
-            return (lower_wick > total_range * 0.6
-                    and upper_wick < total_range * self.upper_wick_max)
-
-        # Standard hammer
-        return (lower_wick >= body * self.wick_body_ratio
-                and upper_wick < total_range * self.upper_wick_max)
-
     def scan(
         self,
         ticker: str,
         ohlcv: pd.DataFrame,
-        fundamentals: pd.Series,
+        fundamentals: Mapping,
+        resampled: Optional[dict] = None,
     ) -> Optional[ScanResult]:
         min_rows = self.d_slow + 20
         if len(ohlcv) < min_rows:
             return None
 
         # --- Weekly trend filter ---
-        weekly = resample_ohlcv(ohlcv, "W")
+        weekly = resampled.get("W") if resampled else None
+        if weekly is None:
+            weekly = resample_ohlcv(ohlcv, "W")
         if len(weekly) < self.w_mid + 2:
             return None
 
-        w_close = weekly["Close"]
-        w_mf = w_close.rolling(self.w_fast).mean().iloc[-1]
-        w_mm = w_close.rolling(self.w_mid).mean().iloc[-1]
-        w_last = w_close.iloc[-1]
+        w_close = weekly["Close"].to_numpy(dtype=np.float64)
+        w_mf = sma(w_close, self.w_fast)[-1]
+        w_mm = sma(w_close, self.w_mid)[-1]
+        w_last = w_close[-1]
 
         # Weekly: price must be above weekly MA20 (intermediate trend intact)
         if not (w_last > w_mm):
@@ -118,16 +102,15 @@ class EntryPointScanner(BaseScanner):
         weekly_full_align = w_last > w_mf > w_mm
 
         # --- Daily trend filter ---
-        close = ohlcv["Close"]
-        d_mxf = close.rolling(self.d_xfast).mean()
-        d_mf = close.rolling(self.d_fast).mean()
-        d_mm = close.rolling(self.d_mid).mean()
-        d_ms = close.rolling(self.d_slow).mean()
+        close = ohlcv["Close"].to_numpy(dtype=np.float64)
 
-        mxf_val = d_mxf.iloc[-1]
-        mf_val = d_mf.iloc[-1]
-        mm_val = d_mm.iloc[-1]
-        ms_val = d_ms.iloc[-1]
+        # The filter only needs the latest value of each MA, so take cheap
+        # tail means first; full MA windows are built below only for the
+        # (few) tickers that survive.
+        mxf_val = close[-self.d_xfast:].mean()
+        mf_val = close[-self.d_fast:].mean()
+        mm_val = close[-self.d_mid:].mean()
+        ms_val = close[-self.d_slow:].mean()
 
         # Daily MAs must be aligned: MA5 > MA10 > MA20
         if not (mxf_val > mf_val > mm_val):
@@ -135,94 +118,53 @@ class EntryPointScanner(BaseScanner):
 
         # Latest close must be above MA20 (the floor)
         # Being below MA10 is fine -- that's the entry zone
-        if close.iloc[-1] < mm_val:
+        if close[-1] < mm_val:
             return None
 
         # MA50 alignment bonus (MA20 > MA50)
         ma50_aligned = mm_val > ms_val
 
-        # --- Scan last N candles for entry signals ---
-        best_signal = None
-        best_score = 0
-        best_details = {}
-
-        for i in range(-self.lookback, 0):
-            idx = len(ohlcv) + i
-            if idx < 0:
-                continue
-
-            ago = -i - 1  # 0 = most recent, 1 = yesterday, 2 = two days ago...
-            # Recency multiplier: ago=0 → 1.0, ago=1 → 0.7, ago=2 → 0.4, ...
-            recency = max(0.0, 1.0 - ago * 0.3)
-
-            row = ohlcv.iloc[idx]
-            c = row["Close"]
-            o = row["Open"]
-            h = row["High"]
-            l = row["Low"]  # noqa: E741
-            ma10 = d_mf.iloc[idx]
-            ma20 = d_mm.iloc[idx]
-
-            for ma_val, ma_label in [(ma10, f"MA{self.d_fast}"), (ma20, f"MA{self.d_mid}")]:
-                close_dist_pct = (c - ma_val) / ma_val * 100
-                low_dist_pct = (l - ma_val) / ma_val * 100
-
-                # Close must be above MA20 (the floor); below MA10 is ok (entry zone)
-                if ma_label == f"MA{self.d_mid}" and c < ma_val:
-                    continue
-
-                # --- Signal 3: HAMMER at MA (strongest) ---
-                is_hammer = self._detect_hammer(o, h, l, c)
-                low_near_ma = abs(low_dist_pct) <= self.touch_pct or low_dist_pct <= 0
-
-                if is_hammer and low_near_ma:
-                    proximity = max(0, (1 - abs(low_dist_pct) / max(self.touch_pct, 0.01))) * 20
-                    s = (40 + proximity) * recency
-                    if s > best_score:
-                        best_score = s
-                        best_signal = "HAMMER"
-                        best_details = {
-                            "ma": ma_label, "low_dist_%": round(abs(low_dist_pct), 2),
-                            "close_dist_%": round(close_dist_pct, 2),
-                            "candle_ago": ago,
-                        }
-                    continue  # Don't also count as touch
-
-                # --- Signal 2: TOUCH (low reached MA, close held near it) ---
-                if low_near_ma:
-                    proximity = max(0, (1 - abs(low_dist_pct) / max(self.touch_pct, 0.01))) * 15
-                    s = (25 + proximity) * recency
-                    if s > best_score:
-                        best_score = s
-                        best_signal = "TOUCH"
-                        best_details = {
-                            "ma": ma_label, "low_dist_%": round(abs(low_dist_pct), 2),
-                            "close_dist_%": round(close_dist_pct, 2),
-                            "candle_ago": ago,
-                        }
-                    continue
-
-                # --- Signal 1: APPROACHING (close near MA, above or slightly below) ---
-                if abs(close_dist_pct) <= self.approach_pct:
-                    proximity = max(0, (1 - abs(close_dist_pct) / self.approach_pct)) * 15
-                    s = (10 + proximity) * recency
-                    if s > best_score:
-                        best_score = s
-                        best_signal = "APPROACHING"
-                        best_details = {
-                            "ma": ma_label, "low_dist_%": round(abs(low_dist_pct), 2),
-                            "close_dist_%": round(close_dist_pct, 2),
-                            "candle_ago": ago,
-                        }
-
-        if best_signal is None:
+        # --- Scan last N candles for entry signals (compiled kernel) ---
+        o_arr = ohlcv["Open"].to_numpy(dtype=np.float64)
+        h_arr = ohlcv["High"].to_numpy(dtype=np.float64)
+        l_arr = ohlcv["Low"].to_numpy(dtype=np.float64)
+
+        # MA10/MA20 over just the candles the kernel looks at (plus warmup)
+        tail = self.lookback
+        mf_tail = sma(close[-(tail + self.d_fast - 1):], self.d_fast)[-tail:]
+        mm_tail = sma(close[-(tail + self.d_mid - 1):], self.d_mid)[-tail:]
+
+        best_score, sig_code, ma_idx, low_dist_pct, close_dist_pct, ago = scan_entry(
+            o_arr[-tail:],
+            h_arr[-tail:],
+            l_arr[-tail:],
+            close[-tail:],
+            mf_tail,
+            mm_tail,
+            self.lookback,
+            self.approach_pct,
+            self.touch_pct,
+            self.wick_body_ratio,
+            self.upper_wick_max,
+        )
+
+        if sig_code == NO_SIGNAL:
             return None
 
+        best_signal = SIGNAL_NAMES[sig_code]
+        best_details = {
+            "ma": f"MA{self.d_fast}" if ma_idx == 0 else f"MA{self.d_mid}",
+            "low_dist_%": round(abs(low_dist_pct), 2),
+            "close_dist_%": round(close_dist_pct, 2),
+            "candle_ago": ago,
+        }
+
         # --- Resistance / ATH analysis ---
-        # ATH from all available history; also check 52-week high
-        ath = ohlcv["High"].max()
-        high_52w = ohlcv["High"].iloc[-252:].max() if len(ohlcv) >= 252 else ath
-        latest_close = close.iloc[-1]
+        # ATH from all available history; also check 52-week high.
+        # All three highs come from the already-extracted High array.
+        ath = h_arr.max()
+        high_52w = h_arr[-252:].max() if len(h_arr) >= 252 else ath
+        latest_close = close[-1]
 
         pct_from_ath = (ath - latest_close) / ath * 100
         pct_from_52w = (high_52w - latest_close) / high_52w * 100
@@ -242,7 +184,7 @@ class EntryPointScanner(BaseScanner):
             resistance_bonus = 0
 
         # Extra: if recent 20-day high is also near ATH, momentum is strong
-        recent_high = ohlcv["High"].iloc[-20:].max()
+        recent_high = h_arr[-20:].max()
         pct_recent_from_ath = (ath - recent_high) / ath * 100
         if pct_recent_from_ath <= 2:
             resistance_bonus += 5  # Recently tested ATH zone
@@ -268,18 +210,18 @@ class EntryPointScanner(BaseScanner):
         best_score += weekly_bonus
 
         # Latest candle green bonus
-        latest_green = close.iloc[-1] > ohlcv["Open"].iloc[-1]
+        latest_green = close[-1] > o_arr[-1]
         if latest_green:
             best_score += 5
 
         score = min(100.0, best_score)
 
         if score >= 65:
-            signal = "STRONG_BUY"
+            signal = STRONG_BUY
         elif score >= 40:
-            signal = "BUY"
+            signal = BUY
         else:
-            signal = "WATCH"
+            signal = WATCH
 
         # Compact entry label: "HMR@M10(0d)"
         _sig_short = {"HAMMER": "HMR", "TOUCH": "TCH", "APPROACHING": "APR"}
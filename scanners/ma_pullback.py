@@ -1,8 +1,10 @@
+from collections.abc import Mapping
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
-from scanners.base import BaseScanner, ScanResult
+from scanners.base import BUY, STRONG_BUY, WATCH, BaseScanner, ScanResult, sma
 from scanners.registry import register
 
 
@@ -38,33 +40,34 @@ class MAPullbackScanner(BaseScanner):
         self,
         ticker: str,
         ohlcv: pd.DataFrame,
-        fundamentals: pd.Series,
+        fundamentals: Mapping,
+        resampled: Optional[dict] = None,
     ) -> Optional[ScanResult]:
         min_period = max(self.ma_long, self.ma_trend)
         if len(ohlcv) < min_period + self.min_trend_days:
             return None
 
-        close = ohlcv["Close"]
-        sma_short = close.rolling(self.ma_short).mean()
-        sma_medium = close.rolling(self.ma_medium).mean()
-        sma_long = close.rolling(self.ma_long).mean()
-        sma_trend = close.rolling(self.ma_trend).mean()
+        close = ohlcv["Close"].to_numpy(dtype=np.float64)
+        sma_short = sma(close, self.ma_short)
+        sma_medium = sma(close, self.ma_medium)
+        sma_long = sma(close, self.ma_long)
+        sma_trend = sma(close, self.ma_trend)
 
-        latest = close.iloc[-1]
-        s = sma_short.iloc[-1]
-        m = sma_medium.iloc[-1]
-        l = sma_long.iloc[-1]  # noqa: E741
-        t = sma_trend.iloc[-1]
+        latest = close[-1]
+        s = sma_short[-1]
+        m = sma_medium[-1]
+        l = sma_long[-1]  # noqa: E741
+        t = sma_trend[-1]
 
         # Check 1: Bullish MA alignment (MA5 > MA10 > MA20)
         if not (s > m > l):
             return None
 
         # Check 2: Alignment has persisted for min_trend_days
-        tail_s = sma_short.tail(self.min_trend_days)
-        tail_m = sma_medium.tail(self.min_trend_days)
-        tail_l = sma_long.tail(self.min_trend_days)
-        alignment_days = int(((tail_s > tail_m) & (tail_m > tail_l)).sum())
+        tail_s = sma_short[-self.min_trend_days:]
+        tail_m = sma_medium[-self.min_trend_days:]
+        tail_l = sma_long[-self.min_trend_days:]
+        alignment_days = np.count_nonzero((tail_s > tail_m) & (tail_m > tail_l))
         if alignment_days < self.min_trend_days:
             return None
 
@@ -83,7 +86,7 @@ class MAPullbackScanner(BaseScanner):
         ma50_bonus = 15 if ma50_aligned else 0
         score = distance_score + spread_score + ma50_bonus
 
-        signal = "STRONG_BUY" if score >= 70 else "BUY" if score >= 40 else "WATCH"
+        signal = STRONG_BUY if score >= 70 else BUY if score >= 40 else WATCH
 
         return ScanResult(
             ticker=ticker,
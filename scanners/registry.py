@@ -9,8 +9,7 @@ _registry: Dict[str, Type[BaseScanner]] = {}
 
 def register(scanner_cls: Type[BaseScanner]) -> Type[BaseScanner]:
     """Decorator to register a scanner class."""
-    instance = scanner_cls()
-    _registry[instance.name] = scanner_cls
+    _registry[scanner_cls.name] = scanner_cls
     return scanner_cls
 
 
@@ -24,7 +23,7 @@ def get_scanner(name: str) -> BaseScanner:
 
 def list_scanners() -> Dict[str, str]:
     """Return {name: description} for all registered scanners."""
-    return {name: cls().description for name, cls in _registry.items()}
+    return {name: cls.description for name, cls in _registry.items()}
 
 
 def auto_discover():
@@ -0,0 +1,86 @@
+import os
+
+from joblib import Parallel, delayed
+from tqdm import tqdm
+
+from scanners.base import BaseScanner, ScanResult
+
+# Shared fallback for tickers missing from the fundamentals cache -- one
+# frozen-by-convention empty mapping instead of a fresh literal per lookup.
+# Scanners only read from fundamentals, so sharing is safe.
+_EMPTY_FUND: dict = {}
+
+
+def _scan_chunk(
+    scanner: BaseScanner, symbols: list[str], fund_records: dict
+) -> list[ScanResult]:
+    """Load and scan one chunk of tickers inside a worker process."""
+    from data.ohlcv_cache import load_ohlcv
+
+    out = []
+    for sym in symbols:
+        ohlcv = load_ohlcv(sym)
+        if ohlcv is None:
+            continue
+        result = scanner.scan(sym, ohlcv, fund_records.get(sym, _EMPTY_FUND))
+        if result is not None:
+            out.append(result)
+    return out
+
+
+def run_scan(
+    scanner: BaseScanner,
+    symbols: list[str],
+    fund_records: dict,
+    chunk_size: int = 100,
+    n_jobs: int | None = None,
+) -> list[ScanResult]:
+    """
+    Scan a ticker list across all cores.
+
+    Each ticker's scan is independent and CPU-bound, so the universe is
+    sharded into chunks and dispatched to joblib worker processes -- one
+    task per chunk, because per-ticker dispatch overhead would eat the
+    gain. Workers read their own parquets instead of receiving frames,
+    so only the scanner, the symbol chunk, and that chunk's fundamentals
+    rows cross the process boundary.
+
+    Args:
+        scanner: Configured scanner instance (must be picklable).
+        symbols: Tickers to scan; ones without an OHLCV cache are skipped.
+        fund_records: {ticker: {field: value}} fundamentals lookup.
+        chunk_size: Tickers per worker task.
+        n_jobs: Worker count; defaults to the CPU count.
+
+    Returns:
+        ScanResults in input order (unsorted).
+    """
+    if not symbols:
+        return []
+    if n_jobs is None:
+        n_jobs = os.cpu_count() or 1
+
+    chunks = [symbols[i : i + chunk_size] for i in range(0, len(symbols), chunk_size)]
+    desc = f"Scanning [{scanner.name}]"
+
+    if n_jobs == 1 or len(chunks) == 1:
+        return [
+            r
+            for chunk in tqdm(chunks, desc=desc)
+            for r in _scan_chunk(scanner, chunk, fund_records)
+        ]
+
+    parallel = Parallel(n_jobs=n_jobs, backend="loky", return_as="generator")
+    batches = parallel(
+        delayed(_scan_chunk)(
+            scanner,
+            chunk,
+            {s: fund_records[s] for s in chunk if s in fund_records},
+        )
+        for chunk in chunks
+    )
+    return [
+        r
+        for batch in tqdm(batches, total=len(chunks), desc=desc)
+        for r in batch
+    ]
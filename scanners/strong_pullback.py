@@ -1,8 +1,18 @@
+from collections.abc import Mapping
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
-from scanners.base import BaseScanner, ScanResult, resample_ohlcv
+from scanners.base import (
+    BUY,
+    STRONG_BUY,
+    WATCH,
+    BaseScanner,
+    ScanResult,
+    resample_ohlcv,
+    sma,
+)
 from scanners.registry import register
 
 
@@ -65,7 +75,8 @@ class StrongPullbackScanner(BaseScanner):
         self,
         ticker: str,
         ohlcv: pd.DataFrame,
-        fundamentals: pd.Series,
+        fundamentals: Mapping,
+        resampled: Optional[dict] = None,
     ) -> Optional[ScanResult]:
         # Need enough daily history for the slowest daily MA
         min_daily = self.d_slow + self.lookback_days + 10
@@ -73,36 +84,34 @@ class StrongPullbackScanner(BaseScanner):
             return None
 
         # --- Weekly filter ---
-        weekly = resample_ohlcv(ohlcv, "W")
+        weekly = resampled.get("W") if resampled else None
+        if weekly is None:
+            weekly = resample_ohlcv(ohlcv, "W")
         if len(weekly) < self.w_slow + 2:
             return None
 
-        w_close = weekly["Close"]
-        w_ma_fast = w_close.rolling(self.w_fast).mean()
-        w_ma_mid = w_close.rolling(self.w_mid).mean()
-        w_ma_slow = w_close.rolling(self.w_slow).mean()
-
-        wf = w_ma_fast.iloc[-1]
-        wm = w_ma_mid.iloc[-1]
-        ws = w_ma_slow.iloc[-1]
-        w_latest = w_close.iloc[-1]
+        w_close = weekly["Close"].to_numpy(dtype=np.float64)
+        wf = sma(w_close, self.w_fast)[-1]
+        wm = sma(w_close, self.w_mid)[-1]
+        ws = sma(w_close, self.w_slow)[-1]
+        w_latest = w_close[-1]
 
         # Weekly must be bullish: close > fast > mid > slow
         if not (w_latest > wf > wm > ws):
             return None
 
         # --- Daily alignment ---
-        close = ohlcv["Close"]
-        low = ohlcv["Low"]
-        d_ma_xfast = close.rolling(self.d_xfast).mean()
-        d_ma_fast = close.rolling(self.d_fast).mean()
-        d_ma_mid = close.rolling(self.d_mid).mean()
-        d_ma_slow = close.rolling(self.d_slow).mean()
-
-        dxf_val = d_ma_xfast.iloc[-1]
-        df_val = d_ma_fast.iloc[-1]
-        dm_val = d_ma_mid.iloc[-1]
-        ds_val = d_ma_slow.iloc[-1]
+        close = ohlcv["Close"].to_numpy(dtype=np.float64)
+        low = ohlcv["Low"].to_numpy(dtype=np.float64)
+        d_ma_xfast = sma(close, self.d_xfast)
+        d_ma_fast = sma(close, self.d_fast)
+        d_ma_mid = sma(close, self.d_mid)
+        d_ma_slow = sma(close, self.d_slow)
+
+        dxf_val = d_ma_xfast[-1]
+        df_val = d_ma_fast[-1]
+        dm_val = d_ma_mid[-1]
+        ds_val = d_ma_slow[-1]
 
         # Daily MAs must be aligned: MA5 > MA10 > MA20
         if not (dxf_val > df_val > dm_val):
@@ -112,28 +121,30 @@ class StrongPullbackScanner(BaseScanner):
         ma50_aligned = dm_val > ds_val
 
         # Alignment must have held for min_align_days (MA5 > MA10 > MA20)
-        tail_xf = d_ma_xfast.tail(self.min_align_days)
-        tail_f = d_ma_fast.tail(self.min_align_days)
-        tail_m = d_ma_mid.tail(self.min_align_days)
-        align_days = int(((tail_xf > tail_f) & (tail_f > tail_m)).sum())
+        tail_xf = d_ma_xfast[-self.min_align_days:]
+        tail_f = d_ma_fast[-self.min_align_days:]
+        tail_m = d_ma_mid[-self.min_align_days:]
+        align_days = np.count_nonzero((tail_xf > tail_f) & (tail_f > tail_m))
         if align_days < self.min_align_days:
             return None
 
         # --- Pullback touch detection ---
         # Look at last N days: did the low come within touch_pct% of MA10 or MA20?
         window = slice(-self.lookback_days, None)
-        recent_low = low.iloc[window]
-        recent_close = close.iloc[window]
-        recent_ma10 = d_ma_fast.iloc[window]
-        recent_ma20 = d_ma_mid.iloc[window]
+        recent_low = low[window]
+        recent_ma10 = d_ma_fast[window]
+        recent_ma20 = d_ma_mid[window]
 
-        # Distance of low from each MA (negative = pierced below)
+        # Distance of low from each MA (negative = pierced below); the abs
+        # arrays feed both the touch test and the tightness score below.
         dist_to_10 = (recent_low - recent_ma10) / recent_ma10 * 100
         dist_to_20 = (recent_low - recent_ma20) / recent_ma20 * 100
+        abs_10 = np.abs(dist_to_10)
+        abs_20 = np.abs(dist_to_20)
 
         # A "touch" means low came within touch_pct% of the MA (above or below)
-        touched_10 = (dist_to_10.abs() <= self.touch_pct).any() or (dist_to_10 <= 0).any()
-        touched_20 = (dist_to_20.abs() <= self.touch_pct).any() or (dist_to_20 <= 0).any()
+        touched_10 = bool(np.any((abs_10 <= self.touch_pct) | (dist_to_10 <= 0)))
+        touched_20 = bool(np.any((abs_20 <= self.touch_pct) | (dist_to_20 <= 0)))
 
         if not (touched_10 or touched_20):
             return None
@@ -142,14 +153,14 @@ class StrongPullbackScanner(BaseScanner):
         if touched_10:
             touch_ma_label = f"MA{self.d_fast}"
             touch_ma_val = df_val
-            best_touch_dist = dist_to_10.abs().min()
+            best_touch_dist = abs_10.min()
         else:
             touch_ma_label = f"MA{self.d_mid}"
             touch_ma_val = dm_val
-            best_touch_dist = dist_to_20.abs().min()
+            best_touch_dist = abs_20.min()
 
         # --- Bounce confirmation ---
-        latest_close = close.iloc[-1]
+        latest_close = close[-1]
         latest_open = ohlcv["Open"].iloc[-1]
 
         # Price must be back above the touched MA
@@ -182,7 +193,7 @@ class StrongPullbackScanner(BaseScanner):
 
         score = touch_score + bounce_score + weekly_score + candle_bonus + ma10_bonus + ma50_bonus
 
-        signal = "STRONG_BUY" if score >= 70 else "BUY" if score >= 45 else "WATCH"
+        signal = STRONG_BUY if score >= 70 else BUY if score >= 45 else WATCH
 
         return ScanResult(
             ticker=ticker,